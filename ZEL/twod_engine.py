@@ -3,6 +3,15 @@ import sys
 import json
 import os
 import math
+import time
+import argparse
+import weakref
+from collections import OrderedDict
+
+try:
+    from pygame._sdl2 import video as sdl2_video
+except ImportError:
+    sdl2_video = None
 
 # --- Global Settings ---
 GAME_TITLE = "TwoD Engine Prototype"
@@ -21,9 +30,18 @@ SETTINGS_FILE = "editor_settings.json"
 DEFAULT_SETTINGS = {
     "grid_color": [255, 255, 255], # Blanc
     "grid_alpha": 127,             # 50% de Transparence
-    "tile_size": 32                # Taille de tuile par défaut
+    "tile_size": 32,               # Taille de tuile par défaut
+    "render_backend": "surface"    # "surface" (logiciel) ou "sdl2" (Renderer/Texture)
 }
 
+# Modes de mélange SDL2 : NONE (copie brute) et BLEND (mélange alpha standard)
+SDL_BLENDMODE_NONE = 0
+SDL_BLENDMODE_BLEND = 1
+# Nombre maximum de textures de texte gardées en cache par le backend SDL2
+TEXT_CACHE_LIMIT = 256
+# Frames non chronométrées avant chaque scène du benchmark (caches, démarrage du renderer)
+BENCHMARK_WARMUP_FRAMES = 10
+
 # --- Utility Function: HSV to RGB Conversion ---
 def hsv_to_rgb(h, s, v):
     """
@@ -62,12 +80,319 @@ def hsv_to_rgb(h, s, v):
 
     return (int(r * 255), int(g * 255), int(b * 255))
 
+# --- Surface Memory Accounting ---
+
+class SurfaceChurnError(Exception):
+    """Raised when a frame allocates more Surfaces/Textures than the allowed budget."""
+    pass
+
+
+class SurfaceTracker:
+    """Counts live Surfaces and Textures, their bytes and allocations per frame, by category."""
+
+    CATEGORIES = ("grid", "ui", "text", "tiles", "caches")
+
+    def __init__(self):
+        self.live_counts = {category: 0 for category in self.CATEGORIES}
+        self.live_bytes = {category: 0 for category in self.CATEGORIES}
+        # Textures SDL2 comptées à part : ce ne sont pas des Surfaces
+        self.live_texture_counts = {category: 0 for category in self.CATEGORIES}
+        self.live_texture_bytes = {category: 0 for category in self.CATEGORIES}
+        self.frame_allocs = {category: 0 for category in self.CATEGORIES}
+        self.last_frame_allocs = {category: 0 for category in self.CATEGORIES}
+        self.peak_frame_allocs = {category: 0 for category in self.CATEGORIES}
+        self.peak_total_allocs = 0
+        self.frames = 0
+
+    def allocate(self, category, nbytes, texture=False):
+        """Records an allocation. Pair it with release() for objects tracked by hand."""
+        counts, sizes = self._live_dicts(texture)
+        counts[category] += 1
+        sizes[category] += nbytes
+        self.frame_allocs[category] += 1
+
+    def release(self, category, nbytes, texture=False):
+        counts, sizes = self._live_dicts(texture)
+        counts[category] -= 1
+        sizes[category] -= nbytes
+
+    def _live_dicts(self, texture):
+        if texture:
+            return self.live_texture_counts, self.live_texture_bytes
+        return self.live_counts, self.live_bytes
+
+    def track(self, surface, category):
+        """Records a Surface and releases it automatically when it is garbage collected."""
+        nbytes = surface.get_pitch() * surface.get_height()
+        self.allocate(category, nbytes)
+        weakref.finalize(surface, self.release, category, nbytes)
+        return surface
+
+    def new_surface(self, category, size, flags=0):
+        return self.track(pygame.Surface(size, flags), category)
+
+    def end_frame(self):
+        """Closes the current frame: its allocations become the 'per frame' numbers."""
+        for category in self.CATEGORIES:
+            self.peak_frame_allocs[category] = max(self.peak_frame_allocs[category], self.frame_allocs[category])
+        self.peak_total_allocs = max(self.peak_total_allocs, sum(self.frame_allocs.values()))
+        self.last_frame_allocs = self.frame_allocs
+        self.frame_allocs = {category: 0 for category in self.CATEGORIES}
+        self.frames += 1
+
+    def reset_peak(self):
+        """Starts a new measuring window for peak_allocs() (e.g. one benchmark scene)."""
+        self.peak_frame_allocs = {category: 0 for category in self.CATEGORIES}
+        self.peak_total_allocs = 0
+
+    def allocs_per_frame(self, category=None):
+        """Allocations during the last finished frame, for one category or all of them."""
+        if category is None:
+            return sum(self.last_frame_allocs.values())
+        return self.last_frame_allocs[category]
+
+    def peak_allocs(self, category=None):
+        """Highest allocations in a single frame since the last reset_peak()."""
+        if category is None:
+            return self.peak_total_allocs
+        return self.peak_frame_allocs[category]
+
+    def check_churn(self, max_allocs_per_frame, category=None):
+        """Raises SurfaceChurnError if any frame since reset_peak() allocated more than allowed."""
+        allocs = self.peak_allocs(category)
+        if allocs > max_allocs_per_frame:
+            scope = category or "all categories"
+            raise SurfaceChurnError(
+                f"Surface churn in {scope}: peak of {allocs} allocations/frame (max {max_allocs_per_frame})"
+            )
+
+    def status_text(self):
+        surface_kb = sum(self.live_bytes.values()) / 1024
+        texture_kb = sum(self.live_texture_bytes.values()) / 1024
+        return (f"Surfaces: {sum(self.live_counts.values())} live, {surface_kb:.0f} KB | "
+                f"Textures: {sum(self.live_texture_counts.values())} live, {texture_kb:.0f} KB | "
+                f"{self.allocs_per_frame()} allocs/frame")
+
+    def dump(self):
+        """Prints the per-category table (bound to 'M' in the editor)."""
+        print(f"--- Surface memory (frame {self.frames}) ---")
+        print(f"{'category':<8} {'surfaces':>9} {'KB':>10} {'textures':>9} {'KB':>10} {'allocs/frame':>13} {'peak':>6}")
+        for category in self.CATEGORIES:
+            print(f"{category:<8} {self.live_counts[category]:>9} {self.live_bytes[category] / 1024:>10.1f} "
+                  f"{self.live_texture_counts[category]:>9} {self.live_texture_bytes[category] / 1024:>10.1f} "
+                  f"{self.last_frame_allocs[category]:>13} {self.peak_frame_allocs[category]:>6}")
+        print(self.status_text())
+
+# --- Drawing Backends ---
+
+class SurfaceBackend:
+    """Software backend: everything is blitted onto the display Surface, then flipped."""
+
+    name = "surface"
+
+    def __init__(self, size, tracker):
+        self.tracker = tracker
+        self.screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+        pygame.display.set_caption(GAME_TITLE)
+
+    def resize(self, size):
+        self.screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+
+    def get_size(self):
+        return self.screen.get_size()
+
+    def fill(self, color):
+        self.screen.fill(color)
+
+    def rect(self, color, rect, width=0):
+        pygame.draw.rect(self.screen, color, rect, width)
+
+    def circle(self, color, center, radius, width=0):
+        pygame.draw.circle(self.screen, color, center, radius, width)
+
+    def lines(self, color, segments):
+        """Draws (start, end) segments; color may carry an alpha value."""
+        overlay = self.tracker.new_surface("grid", self.screen.get_size(), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 0)) # Completely transparent background
+        for start, end in segments:
+            pygame.draw.line(overlay, color, start, end)
+        self.screen.blit(overlay, (0, 0))
+
+    def blit(self, surface, pos):
+        self.screen.blit(surface, pos)
+
+    def text(self, font, text, color, pos, cache=True):
+        """Renders and draws text at pos. Returns the Rect it covers. Nothing is cached here."""
+        text_surface = self.tracker.track(font.render(text, True, color), "text")
+        self.screen.blit(text_surface, pos)
+        return text_surface.get_rect(topleft=pos)
+
+    def present(self):
+        pygame.display.flip()
+
+    def close(self):
+        pass
+
+
+class RendererBackend:
+    """SDL2 backend: draws through pygame._sdl2.video Renderer/Texture instead of the CPU."""
+
+    name = "sdl2"
+
+    def __init__(self, size, tracker):
+        self.tracker = tracker
+        self.window = sdl2_video.Window(GAME_TITLE, size=size, resizable=True)
+        try:
+            self.renderer = sdl2_video.Renderer(self.window, target_texture=True)
+        except pygame.error:
+            # Pas de pilote accéléré (ex: Linux sans GPU) : renderer logiciel de SDL
+            self.renderer = sdl2_video.Renderer(self.window, accelerated=0, target_texture=True)
+        self.renderer.draw_blend_mode = SDL_BLENDMODE_BLEND
+        # Cache LRU : les libellés fixes restent, les textes qui changent à chaque frame sont évincés
+        self.text_cache = OrderedDict()
+        self.circle_cache = {}
+        # Texture cible de la grille, recréée seulement quand la fenêtre change de taille
+        self.grid_texture = None
+
+    def resize(self, size):
+        # The renderer output follows the window size, nothing to recreate
+        pass
+
+    def get_size(self):
+        return self.window.size
+
+    def fill(self, color):
+        self.renderer.draw_color = pygame.Color(color)
+        self.renderer.clear()
+
+    def rect(self, color, rect, width=0):
+        self.renderer.draw_color = pygame.Color(color)
+        if width == 0:
+            self.renderer.fill_rect(rect)
+        else:
+            # Like pygame.draw.rect: a border `width` pixels thick, drawn inside the rect
+            rect = pygame.Rect(rect)
+            for i in range(width):
+                self.renderer.draw_rect(rect.inflate(-2 * i, -2 * i))
+
+    def circle(self, color, center, radius, width=0):
+        """SDL has no circle primitive: draw it once on a Surface and reuse the Texture."""
+        key = (tuple(color), radius, width)
+        texture = self.circle_cache.get(key)
+        if texture is None:
+            size = radius * 2 + 2
+            circle_surface = self.tracker.new_surface("ui", (size, size), pygame.SRCALPHA)
+            pygame.draw.circle(circle_surface, color, (radius + 1, radius + 1), radius, width)
+            texture = sdl2_video.Texture.from_surface(self.renderer, circle_surface)
+            # Textures can't be weak-referenced: cached ones are accounted by hand
+            self.tracker.allocate("caches", texture_bytes(texture), texture=True)
+            self.circle_cache[key] = texture
+        texture.draw(dstrect=(center[0] - radius - 1, center[1] - radius - 1))
+
+    def lines(self, color, segments):
+        """Draws (start, end) segments; color may carry an alpha value.
+        Like the Surface path, lines go unblended into one overlay that is blended once,
+        so crossings are not blended twice."""
+        size = self.window.size
+        if self.grid_texture is None or (self.grid_texture.width, self.grid_texture.height) != size:
+            if self.grid_texture is not None:
+                self.tracker.release("grid", texture_bytes(self.grid_texture), texture=True)
+            self.grid_texture = sdl2_video.Texture(self.renderer, size, target=True)
+            self.grid_texture.blend_mode = SDL_BLENDMODE_BLEND
+            self.tracker.allocate("grid", texture_bytes(self.grid_texture), texture=True)
+        
+        self.renderer.target = self.grid_texture
+        self.renderer.draw_blend_mode = SDL_BLENDMODE_NONE
+        self.renderer.draw_color = pygame.Color(0, 0, 0, 0) # Completely transparent background
+        self.renderer.clear()
+        self.renderer.draw_color = pygame.Color(color)
+        for start, end in segments:
+            self.renderer.draw_line(start, end)
+        self.renderer.draw_blend_mode = SDL_BLENDMODE_BLEND
+        self.renderer.target = None
+        
+        self.grid_texture.draw()
+
+    def blit(self, surface, pos):
+        texture = sdl2_video.Texture.from_surface(self.renderer, surface)
+        texture.draw(dstrect=pos)
+        # One-shot upload: counts as churn, never stays alive
+        self.tracker.allocate("ui", texture_bytes(texture), texture=True)
+        self.tracker.release("ui", texture_bytes(texture), texture=True)
+
+    def text(self, font, text, color, pos, cache=True):
+        """Draws text from a cached Texture. Returns the Rect it covers.
+        Use cache=False for text that changes every frame, so it doesn't fill the cache."""
+        if not cache:
+            text_surface = self.tracker.track(font.render(text, True, color), "text")
+            texture = sdl2_video.Texture.from_surface(self.renderer, text_surface)
+            texture.draw(dstrect=pos)
+            self.tracker.allocate("text", texture_bytes(texture), texture=True)
+            self.tracker.release("text", texture_bytes(texture), texture=True)
+            return pygame.Rect(pos, (texture.width, texture.height))
+        
+        key = (id(font), text, tuple(color))
+        texture = self.text_cache.get(key)
+        if texture is not None:
+            self.text_cache.move_to_end(key)
+        else:
+            if len(self.text_cache) >= TEXT_CACHE_LIMIT:
+                _, evicted_texture = self.text_cache.popitem(last=False)
+                self.tracker.release("caches", texture_bytes(evicted_texture), texture=True)
+            text_surface = self.tracker.track(font.render(text, True, color), "text")
+            texture = sdl2_video.Texture.from_surface(self.renderer, text_surface)
+            self.tracker.allocate("caches", texture_bytes(texture), texture=True)
+            self.text_cache[key] = texture
+        texture.draw(dstrect=pos)
+        return pygame.Rect(pos, (texture.width, texture.height))
+
+    def present(self):
+        self.renderer.present()
+
+    def close(self):
+        """Frees every Texture before pygame.quit(): destroying them after SDL shuts down crashes."""
+        for texture in self.text_cache.values():
+            self.tracker.release("caches", texture_bytes(texture), texture=True)
+        for texture in self.circle_cache.values():
+            self.tracker.release("caches", texture_bytes(texture), texture=True)
+        if self.grid_texture is not None:
+            self.tracker.release("grid", texture_bytes(self.grid_texture), texture=True)
+        self.text_cache.clear()
+        self.circle_cache.clear()
+        self.grid_texture = None
+        self.renderer = None
+        self.window = None
+
+
+def texture_bytes(texture):
+    """Approximate memory used by an SDL2 Texture (4 bytes per pixel)."""
+    return texture.width * texture.height * 4
+
+
+def create_backend(name, size, tracker):
+    """Creates the drawing backend selected by name, falling back to the Surface one."""
+    if name == RendererBackend.name:
+        if sdl2_video is None:
+            print("pygame._sdl2 is not available. Falling back to the Surface backend.")
+        else:
+            try:
+                return RendererBackend(size, tracker)
+            except pygame.error as e:
+                print(f"Could not create the SDL2 renderer ({e}). Falling back to the Surface backend.")
+    elif name != SurfaceBackend.name:
+        print(f"Unknown render backend '{name}'. Using the Surface backend.")
+    return SurfaceBackend(size, tracker)
+
 # --- PyGame Main Engine Class ---
 
 class TwoDEngine:
-    def __init__(self):
+    def __init__(self, render_backend=None):
         self.settings = DEFAULT_SETTINGS.copy()
         self.settings_loaded = False
+        # Backend forcé en ligne de commande (sinon lu dans le JSON)
+        self.render_backend = render_backend
+        # Comptage des Surfaces vivantes (overlay de statut et touche 'M')
+        self.surface_tracker = SurfaceTracker()
         
         # Tentative de convertir la couleur par défaut (blanc) en HSV pour initialisation
         # Le blanc (255, 255, 255) correspond à H: 0, S: 0.0, V: 1.0
@@ -123,11 +448,9 @@ class TwoDEngine:
         pygame.init()
         
         # Pygame Setup
-        self.screen = pygame.display.set_mode(
-            (INITIAL_WIDTH, INITIAL_HEIGHT), 
-            pygame.RESIZABLE
-        )
-        pygame.display.set_caption(GAME_TITLE)
+        backend_name = self.render_backend or self.settings.get('render_backend', DEFAULT_SETTINGS['render_backend'])
+        self.backend = create_backend(backend_name, (INITIAL_WIDTH, INITIAL_HEIGHT), self.surface_tracker)
+        print(f"Using the '{self.backend.name}' render backend.")
         self.clock = pygame.time.Clock()
         self.running = True
         self.font = pygame.font.Font(None, FONT_SIZE)
@@ -246,10 +569,7 @@ class TwoDEngine:
                     self.running = False
                 
                 if event.type == pygame.VIDEORESIZE:
-                    self.screen = pygame.display.set_mode(
-                        (event.w, event.h), 
-                        pygame.RESIZABLE
-                    )
+                    self.backend.resize((event.w, event.h))
                 
                 # Input Handling
                 if event.type == pygame.KEYDOWN and self.editor_mode:
@@ -268,6 +588,10 @@ class TwoDEngine:
                         self.editor_menu_open = False
                         self.color_picker_open = False 
                         
+                    # Dump Surface Memory ('M')
+                    elif event.key == pygame.K_m:
+                        self.surface_tracker.dump()
+                        
                     # Handle Settings changes only if the settings menu is open
                     elif self.settings_menu_open:
                         self.handle_settings_input(event.key)
@@ -334,53 +658,106 @@ class TwoDEngine:
             if self.editor_mode:
                 self.draw_editor()
                 
-            pygame.display.flip()
+            self.backend.present()
+            self.surface_tracker.end_frame()
             self.clock.tick(60)
 
         # Cleanup
+        self.backend.close()
         pygame.quit()
         sys.exit()
 
+    def run_benchmark(self, frames, max_allocs_per_frame=None):
+        """Draws editor frames without the 60 FPS cap and prints the average frame time per scene.
+        If max_allocs_per_frame is given, raises SurfaceChurnError when any frame of a scene allocates more."""
+        
+        self.initialize_pygame()
+        print(f"Benchmarking the '{self.backend.name}' backend ({frames} frames per scene, "
+              f"{BENCHMARK_WARMUP_FRAMES} warm-up frames)...")
+        
+        # (nom de la scène, menu éditeur ouvert, menu paramètres ouvert)
+        scenes = [
+            ("grid only", False, False),
+            ("editor menu", True, False),
+            ("settings menu", False, True),
+        ]
+        
+        for scene_name, editor_menu_open, settings_menu_open in scenes:
+            self.editor_menu_open = editor_menu_open
+            self.settings_menu_open = settings_menu_open
+            
+            # Untimed warm-up: renderer start-up and first Texture uploads
+            for _ in range(BENCHMARK_WARMUP_FRAMES):
+                self.draw_benchmark_frame()
+            
+            # The churn budget only looks at steady-state frames, not the one-time cache fill
+            self.surface_tracker.reset_peak()
+            start = time.perf_counter()
+            for _ in range(frames):
+                self.draw_benchmark_frame()
+            elapsed = time.perf_counter() - start
+            
+            print(f"  {scene_name}: {elapsed * 1000 / frames:.2f} ms/frame | {self.surface_tracker.status_text()} "
+                  f"(peak {self.surface_tracker.peak_allocs()})")
+            if max_allocs_per_frame is not None:
+                try:
+                    self.surface_tracker.check_churn(max_allocs_per_frame)
+                except SurfaceChurnError:
+                    self.surface_tracker.dump()
+                    self.backend.close()
+                    pygame.quit()
+                    raise
+
+        self.surface_tracker.dump()
+        self.backend.close()
+        pygame.quit()
+
+    def draw_benchmark_frame(self):
+        """Draws one benchmark frame while panning the camera."""
+        pygame.event.pump()
+        self.camera_x += 1 # Keep the grid moving like a real pan
+        self.draw_editor()
+        self.backend.present()
+        self.surface_tracker.end_frame()
+
     def draw_grid(self):
         """Draws the transparent, zoomable, and pannable grid."""
         
-        current_width, current_height = self.screen.get_size()
+        current_width, current_height = self.backend.get_size()
         tile_size = self.settings['tile_size']
         
         # Calculate zoomed grid step
         step = tile_size * self.zoom_level
         
-        # Get the color and create a transparent surface
+        # Get the color and adjust transparency
         r, g, b = self.settings['grid_color']
-        grid_surface = pygame.Surface((current_width, current_height), pygame.SRCALPHA)
-        grid_surface.fill((0, 0, 0, 0)) # Completely transparent background
-        
-        # Adjust transparency
         alpha = self.settings['grid_alpha']
         color_with_alpha = (r, g, b, alpha)
         
+        segments = []
+        
         # Vertical lines
         x_start = self.camera_x % step - step
         while x_start < current_width:
-            pygame.draw.line(grid_surface, color_with_alpha, (int(x_start), 0), (int(x_start), current_height))
+            segments.append(((int(x_start), 0), (int(x_start), current_height)))
             x_start += step
 
         # Horizontal lines
         y_start = self.camera_y % step - step
         while y_start < current_height:
-            pygame.draw.line(grid_surface, color_with_alpha, (0, int(y_start)), (current_width, int(y_start)))
+            segments.append(((0, int(y_start)), (current_width, int(y_start))))
             y_start += step
             
-        # Draw the transparent grid surface onto the main screen
-        self.screen.blit(grid_surface, (0, 0))
+        # Let the backend blend the transparent lines onto the screen
+        self.backend.lines(color_with_alpha, segments)
 
     def draw_editor(self):
         """Draws the current state of the game editor."""
         
-        current_width, current_height = self.screen.get_size()
+        current_width, current_height = self.backend.get_size()
         
         # 1. Background (Map View)
-        self.screen.fill(BLACK)
+        self.backend.fill(BLACK)
         
         # 2. Draw Grid (Panoramique et Zoomable)
         self.draw_grid()
@@ -393,7 +770,7 @@ class TwoDEngine:
             menu_x = current_width - menu_width
             
             # Menu Background
-            pygame.draw.rect(self.screen, GRAY, (menu_x, 0, menu_width, menu_height))
+            self.backend.rect(GRAY, (menu_x, 0, menu_width, menu_height))
             
             if self.editor_menu_open:
                 self.draw_menu_content(menu_x, menu_width, "EDITOR MENU ('0' to close)") 
@@ -403,8 +780,9 @@ class TwoDEngine:
 
         # 4. Status Text (Always on top)
         status_text = f"Zoom: {self.zoom_level:.2f} | Cam: ({self.camera_x:.0f}, {self.camera_y:.0f}) | T_Size: {self.settings['tile_size']}"
-        text_surface = self.font.render(status_text, True, LIGHT_GRAY)
-        self.screen.blit(text_surface, (10, 10))
+        # Ces lignes changent presque à chaque frame : pas de cache de texture
+        status_rect = self.backend.text(self.font, status_text, LIGHT_GRAY, (10, 10), cache=False)
+        self.backend.text(self.font, self.surface_tracker.status_text(), LIGHT_GRAY, (10, status_rect.bottom + 5), cache=False)
         
     def draw_menu_content(self, menu_x, menu_width, title):
         """Draws generic menu content."""
@@ -413,9 +791,8 @@ class TwoDEngine:
         y_offset = 30 
         
         # Title
-        title_surface = self.font.render(title, True, WHITE)
-        self.screen.blit(title_surface, (menu_x + padding, y_offset))
-        y_offset += title_surface.get_height() + padding
+        title_rect = self.backend.text(self.font, title, WHITE, (menu_x + padding, y_offset))
+        y_offset += title_rect.height + padding
         
         # Placeholder content
         content_lines = [
@@ -424,9 +801,8 @@ class TwoDEngine:
         ]
         
         for line in content_lines:
-            line_surface = self.font.render(line, True, LIGHT_GRAY)
-            self.screen.blit(line_surface, (menu_x + padding, y_offset))
-            y_offset += line_surface.get_height() + 5
+            line_rect = self.backend.text(self.font, line, LIGHT_GRAY, (menu_x + padding, y_offset))
+            y_offset += line_rect.height + 5
 
     def draw_settings_content(self, menu_x, menu_width):
         """Draws the dedicated Settings menu with complex UI elements (sliders, buttons)."""
@@ -436,14 +812,12 @@ class TwoDEngine:
         
         # 1. Title
         title = "SETTINGS MENU ('1' to close)"
-        title_surface = self.font.render(title, True, WHITE)
-        self.screen.blit(title_surface, (menu_x + padding, y_offset))
-        y_offset += title_surface.get_height() + padding * 2
+        title_rect = self.backend.text(self.font, title, WHITE, (menu_x + padding, y_offset))
+        y_offset += title_rect.height + padding * 2
 
         # 2. Grid Settings Header
-        header_surface = self.font.render("Grid Settings:", True, LIGHT_GRAY)
-        self.screen.blit(header_surface, (menu_x + padding, y_offset))
-        y_offset += header_surface.get_height() + padding 
+        header_rect = self.backend.text(self.font, "Grid Settings:", LIGHT_GRAY, (menu_x + padding, y_offset))
+        y_offset += header_rect.height + padding 
 
         # --- 3. Color Picker / Display ---
         
@@ -473,8 +847,8 @@ class TwoDEngine:
             cursor_x = center_x + cursor_dist * math.cos(angle_rad)
             cursor_y = center_y + cursor_dist * math.sin(angle_rad)
             
-            pygame.draw.circle(self.screen, BLACK, (int(cursor_x), int(cursor_y)), 8, 2) 
-            pygame.draw.circle(self.screen, WHITE, (int(cursor_x), int(cursor_y)), 6, 2)
+            self.backend.circle(BLACK, (int(cursor_x), int(cursor_y)), 8, 2) 
+            self.backend.circle(WHITE, (int(cursor_x), int(cursor_y)), 6, 2)
 
 
         y_offset += picker_area_size + padding
@@ -482,41 +856,40 @@ class TwoDEngine:
         # A. Current Color Display and Info
         current_color = self.settings['grid_color']
         color_text = f"Current RGB: {current_color}"
-        color_surface = self.font.render(color_text, True, WHITE)
+        color_text_height = self.font.size(color_text)[1]
         
         # Color Swatch (Affichage de la couleur)
         swatch_size = 40
         swatch_rect = pygame.Rect(menu_x + padding, y_offset, swatch_size, swatch_size)
-        pygame.draw.rect(self.screen, current_color, swatch_rect)
-        pygame.draw.rect(self.screen, WHITE, swatch_rect, 1) # Border
+        self.backend.rect(current_color, swatch_rect)
+        self.backend.rect(WHITE, swatch_rect, 1) # Border
         
-        self.screen.blit(color_surface, (menu_x + padding + swatch_size + padding, y_offset + (swatch_size - color_surface.get_height()) // 2))
+        self.backend.text(self.font, color_text, WHITE, (menu_x + padding + swatch_size + padding, y_offset + (swatch_size - color_text_height) // 2))
         y_offset += swatch_size + padding
 
         # B. Color Picker Button
         picker_text = "Toggle Color Picker (Click)"
-        picker_surface = self.font.render(picker_text, True, BLACK if self.color_picker_open else WHITE)
+        picker_text_width, picker_text_height = self.font.size(picker_text)
         picker_padding_y = 5
         
         self.color_button_rect = pygame.Rect(
             menu_x + padding, 
             y_offset, 
-            picker_surface.get_width() + padding * 2, 
-            picker_surface.get_height() + picker_padding_y * 2
+            picker_text_width + padding * 2, 
+            picker_text_height + picker_padding_y * 2
         )
         
         picker_color = (100, 200, 100) if not self.color_picker_open else (255, 100, 100) # Green / Red toggle
-        pygame.draw.rect(self.screen, picker_color, self.color_button_rect)
-        self.screen.blit(picker_surface, (menu_x + padding * 2, y_offset + picker_padding_y))
+        self.backend.rect(picker_color, self.color_button_rect)
+        self.backend.text(self.font, picker_text, BLACK if self.color_picker_open else WHITE, (menu_x + padding * 2, y_offset + picker_padding_y))
         y_offset += self.color_button_rect.height + padding * 2
 
         # --- 4. Transparency Slider ---
         
         # A. Draw Text and Value
         transparency_text = f"Transparency (0-255): {self.settings['grid_alpha']}"
-        text_surface = self.font.render(transparency_text, True, WHITE)
-        self.screen.blit(text_surface, (menu_x + padding, y_offset))
-        y_offset += text_surface.get_height() + 5 
+        text_rect = self.backend.text(self.font, transparency_text, WHITE, (menu_x + padding, y_offset))
+        y_offset += text_rect.height + 5 
 
         # B. Draw Slider Track
         track_height = 8
@@ -524,7 +897,7 @@ class TwoDEngine:
         track_y = y_offset
         
         self.transparency_slider_track = (menu_x + padding, track_y, track_width, track_height)
-        pygame.draw.rect(self.screen, LIGHT_GRAY, self.transparency_slider_track)
+        self.backend.rect(LIGHT_GRAY, self.transparency_slider_track)
         
         # C. Draw Slider Handle (Represents current alpha)
         alpha_ratio = self.settings['grid_alpha'] / 255.0
@@ -539,29 +912,28 @@ class TwoDEngine:
             handle_radius * 2
         )
         
-        pygame.draw.circle(self.screen, WHITE, (handle_x, handle_y), handle_radius)
+        self.backend.circle(WHITE, (handle_x, handle_y), handle_radius)
         y_offset += track_height + padding * 2
         
         # --- 5. Reset Button ---
         reset_text = "RESET GRID SETTINGS (and Save)"
-        reset_surface = self.font.render(reset_text, True, BLACK)
+        reset_text_width, reset_text_height = self.font.size(reset_text)
         reset_padding_y = 5
         
         self.reset_button_rect = pygame.Rect(
             menu_x + padding, 
             y_offset, 
-            reset_surface.get_width() + padding * 2, 
-            reset_surface.get_height() + reset_padding_y * 2
+            reset_text_width + padding * 2, 
+            reset_text_height + reset_padding_y * 2
         )
         
-        pygame.draw.rect(self.screen, LIGHT_GRAY, self.reset_button_rect)
-        self.screen.blit(reset_surface, (menu_x + padding * 2, y_offset + reset_padding_y))
+        self.backend.rect(LIGHT_GRAY, self.reset_button_rect)
+        self.backend.text(self.font, reset_text, BLACK, (menu_x + padding * 2, y_offset + reset_padding_y))
         y_offset += self.reset_button_rect.height + padding * 2
 
         # --- 6. Languages (Placeholder for .lang2D) ---
-        lang_header = self.font.render("Languages settings:", True, LIGHT_GRAY)
-        self.screen.blit(lang_header, (menu_x + padding, y_offset))
-        y_offset += lang_header.get_height() + padding
+        lang_header_rect = self.backend.text(self.font, "Languages settings:", LIGHT_GRAY, (menu_x + padding, y_offset))
+        y_offset += lang_header_rect.height + padding
         
         lang_lines = [
             "Reset Languages (Coming Soon)", 
@@ -569,14 +941,13 @@ class TwoDEngine:
         ]
         
         for line in lang_lines:
-            line_surface = self.font.render(line, True, WHITE)
-            self.screen.blit(line_surface, (menu_x + padding, y_offset))
-            y_offset += line_surface.get_height() + 5 
+            line_rect = self.backend.text(self.font, line, WHITE, (menu_x + padding, y_offset))
+            y_offset += line_rect.height + 5 
             
     def draw_color_wheel(self, rect):
         """Dessine une roue chromatique HSV en utilisant la conversion HSV vers RGB."""
         
-        wheel_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+        wheel_surface = self.surface_tracker.new_surface("ui", (rect.width, rect.height), pygame.SRCALPHA)
         
         center_x = rect.width // 2
         center_y = rect.height // 2
@@ -607,10 +978,26 @@ class TwoDEngine:
                 else:
                     wheel_surface.set_at((x, y), (0, 0, 0, 0)) # Transparent en dehors du cercle
                     
-        self.screen.blit(wheel_surface, (rect.x, rect.y))
-        pygame.draw.circle(self.screen, WHITE, rect.center, int(radius) + 1, 1) 
+        self.backend.blit(wheel_surface, (rect.x, rect.y))
+        self.backend.circle(WHITE, rect.center, int(radius) + 1, 1) 
 
 # --- Execution ---
 if __name__ == "__main__":
-    game = TwoDEngine()
-    game.run()
+    parser = argparse.ArgumentParser(description=GAME_TITLE)
+    parser.add_argument("--renderer", choices=[SurfaceBackend.name, RendererBackend.name],
+                        help="Render backend to use (overrides 'render_backend' in the settings file)")
+    parser.add_argument("--benchmark", type=int, metavar="FRAMES",
+                        help="Draw FRAMES uncapped frames per scene, print the average frame time and exit")
+    parser.add_argument("--max-allocs-per-frame", type=int, metavar="N",
+                        help="With --benchmark, exit with code 1 if any frame allocates more than N Surfaces/Textures")
+    args = parser.parse_args()
+    
+    game = TwoDEngine(render_backend=args.renderer)
+    if args.benchmark:
+        try:
+            game.run_benchmark(args.benchmark, args.max_allocs_per_frame)
+        except SurfaceChurnError as e:
+            print(f"Benchmark failed: {e}")
+            sys.exit(1)
+    else:
+        game.run()
@@ -0,0 +1,74 @@
+import gc
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "ZEL"))
+
+import pygame
+from twod_engine import SurfaceTracker, SurfaceChurnError
+
+
+def test_live_counts_drop_when_surface_is_collected():
+    tracker = SurfaceTracker()
+    surface = tracker.new_surface("grid", (16, 8), pygame.SRCALPHA)
+    nbytes = surface.get_pitch() * surface.get_height()
+
+    assert tracker.live_counts["grid"] == 1
+    assert tracker.live_bytes["grid"] == nbytes
+
+    del surface
+    gc.collect()
+
+    assert tracker.live_counts["grid"] == 0
+    assert tracker.live_bytes["grid"] == 0
+
+
+def test_textures_are_counted_apart_from_surfaces():
+    tracker = SurfaceTracker()
+    tracker.allocate("caches", 400, texture=True)
+
+    assert tracker.live_texture_counts["caches"] == 1
+    assert tracker.live_counts["caches"] == 0
+
+    tracker.release("caches", 400, texture=True)
+
+    assert tracker.live_texture_bytes["caches"] == 0
+
+
+def test_last_frame_allocs_per_category():
+    tracker = SurfaceTracker()
+    tracker.new_surface("text", (4, 4))
+    tracker.new_surface("text", (4, 4))
+    tracker.new_surface("ui", (4, 4))
+    tracker.end_frame()
+
+    assert tracker.last_frame_allocs["text"] == 2
+    assert tracker.last_frame_allocs["ui"] == 1
+    assert tracker.last_frame_allocs["grid"] == 0
+    assert tracker.allocs_per_frame() == 3
+
+    tracker.end_frame()
+
+    assert tracker.allocs_per_frame() == 0
+    assert tracker.peak_allocs() == 3
+
+
+def test_check_churn_budget():
+    tracker = SurfaceTracker()
+    for _ in range(3):
+        tracker.new_surface("grid", (4, 4))
+    tracker.end_frame()
+
+    tracker.check_churn(3)
+    with pytest.raises(SurfaceChurnError):
+        tracker.check_churn(2)
+    with pytest.raises(SurfaceChurnError):
+        tracker.check_churn(2, category="grid")
+    tracker.check_churn(0, category="text")
+
+    tracker.reset_peak()
+    tracker.end_frame()
+    tracker.check_churn(0)